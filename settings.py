@@ -45,6 +45,9 @@ BASE_OUTPUT_DIR = HOME / "Downloads" / "vcat_test_vectors"
 # Manifest subdirectory
 MANIFEST_DIR = BASE_OUTPUT_DIR / "manifests"
 
+# Persistent checksum cache; it holds local paths, so it lives outside the output tree
+CHECKSUM_CACHE_FILE = HOME / ".cache" / "vcat-test-vectors" / "checksum_cache.json"
+
 #
 # ── Catalog settings ──────────────────────────────────────────────────────────
 #
@@ -28,21 +28,231 @@
 #
 # Contact: legal@roncatech.com
 
+import atexit
 import hashlib
+import json
+import mmap
 import os
+import sys
+from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def getChecksum(local_file_path):
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# Read size for the pre-3.11 fallback; 1 MiB keeps SHA256 busy between reads
+CHECKSUM_BLOCK_SIZE = 1 << 20
+
+# Files larger than this are hashed straight from a memory map
+CHECKSUM_MMAP_THRESHOLD = 8 << 20
+
+# Algorithms accepted by getFileHasher; "auto" picks the fastest on this machine
+CHECKSUM_ALGORITHMS = ("sha256", "blake3", "xxh3", "auto")
+
+# Checksums keyed by absolute path, valid while size and mtime are unchanged
+_checksum_cache = {}
+_checksum_cache_file = None
+
+# Entries computed by this process, merged into the file on save
+_checksum_cache_updates = {}
+
+
+def _cpuHasShaExtensions():
+    """
+    Check /proc/cpuinfo for hardware SHA256 support (x86 SHA-NI or ARMv8 sha2).
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            flags = set(f.read().split())
+    except OSError:
+        return False
+
+    return "sha_ni" in flags or "sha2" in flags
+
+
+def getFileHasher(algorithm="sha256"):
+    """
+    Return the (name, constructor) pair of the hash used for file checksums.
+
+    "auto" keeps SHA256 on CPUs with SHA extensions and otherwise uses BLAKE3
+    if the blake3 package is installed. "xxh3" is a non-cryptographic 64-bit
+    hash that only guards against accidental corruption.
+    """
+    if algorithm == "auto":
+        algorithm = "blake3" if blake3 is not None and not _cpuHasShaExtensions() else "sha256"
+
+    if algorithm == "sha256":
+        return "sha256", hashlib.sha256
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ValueError("blake3 checksums require the 'blake3' package")
+        return "blake3", blake3
+    if algorithm == "xxh3":
+        if xxhash is None:
+            raise ValueError("xxh3 checksums require the 'xxhash' package")
+        return "xxh3", xxhash.xxh3_64
+
+    raise ValueError(f"Unknown checksum algorithm: {algorithm}")
+
+
+def getChecksum(local_file_path, algorithm="sha256"):
+    """
+    Calculate the checksum of a local file, using SHA256 unless another
+    algorithm from getFileHasher is requested.
+    """
+    _, hasher = getFileHasher(algorithm)
+
+    if sys.platform != "win32" and os.path.getsize(local_file_path) > CHECKSUM_MMAP_THRESHOLD:
+        return _getChecksumMapped(local_file_path, hasher)
+
+    with open(local_file_path, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, hasher).hexdigest()
+
+        file_hash = hasher()
+        while chunk := f.read(CHECKSUM_BLOCK_SIZE):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+def _getChecksumMapped(local_file_path, hasher):
+    """
+    Hash a large file in a single update over a read-only memory map.
+    """
+    file_hash = hasher()
+
+    with open(local_file_path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            file_hash.update(view)
+
+    return file_hash.hexdigest()
+
+
+def loadChecksumCache(cache_file):
     """
-    Calculate the checksum of a local file using SHA256.
+    Load the persistent checksum cache and save it back when the process exits.
     """
-    hash_sha256 = hashlib.sha256()
+    global _checksum_cache_file
 
-    with open(local_file_path, "rb") as f:
-        while chunk := f.read(4096):
-            hash_sha256.update(chunk)
+    if _checksum_cache_file is None:
+        atexit.register(saveChecksumCache)
+    _checksum_cache_file = Path(cache_file)
 
-    return hash_sha256.hexdigest()
+    try:
+        _checksum_cache.update(json.loads(_checksum_cache_file.read_bytes()))
+    except (OSError, ValueError):
+        pass
+
+
+def saveChecksumCache():
+    """
+    Merge this process's new checksums into the cache file, dropping entries
+    for files that no longer exist. The file is replaced atomically so
+    builders running side by side never leave it half written.
+    """
+    if _checksum_cache_file is None:
+        return
+
+    try:
+        on_disk = json.loads(_checksum_cache_file.read_bytes())
+    except (OSError, ValueError):
+        on_disk = {}
+    cache = {**on_disk, **_checksum_cache_updates}
+    cache = {path: entry for path, entry in cache.items() if os.path.exists(path)}
+    if cache == on_disk:
+        return
+
+    tmp_file = _checksum_cache_file.with_name(f"{_checksum_cache_file.name}.{os.getpid()}.tmp")
+    try:
+        _checksum_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(cache))
+        os.replace(tmp_file, _checksum_cache_file)
+        _checksum_cache_updates.clear()
+    except OSError as e:
+        tmp_file.unlink(missing_ok=True)
+        print(f"Warning: could not write checksum cache {_checksum_cache_file}: {e}")
+
+
+def getChecksumCached(local_file_path, size_and_mtime=None, algorithm="sha256"):
+    """
+    Same as getChecksum, but reuse the previous digest if the file's size
+    and mtime have not changed since it was computed.
+
+    Pass size_and_mtime from getFileSizeAndMtime to avoid a second stat.
+    """
+    path = os.path.abspath(local_file_path)
+    size, mtime_ns = size_and_mtime or getFileSizeAndMtime(path)
+
+    entry = _checksum_cache.get(path)
+    if (entry and entry["size"] == size and entry["mtime_ns"] == mtime_ns
+            and entry.get("algorithm", "sha256") == algorithm):
+        return entry["checksum"]
+
+    checksum = getChecksum(path, algorithm)
+    _checksum_cache[path] = _checksum_cache_updates[path] = {
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "algorithm": algorithm,
+        "checksum": checksum
+    }
+
+    return checksum
+
+
+def getChecksumAndLength(local_file_path, algorithm="sha256"):
+    """
+    Return (checksum, length_bytes) of a file from a single stat,
+    reusing the cached checksum when the file is unchanged.
+    """
+    size_and_mtime = getFileSizeAndMtime(local_file_path)
+    return getChecksumCached(local_file_path, size_and_mtime, algorithm), size_and_mtime[0]
+
+
+def dumpJson(obj, indent=True):
+    """
+    Serialize obj to JSON bytes, using orjson when it is installed.
+    Output is indented by 2 spaces, or fully compact with indent=False.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def writeJsonWithChecksum(path, obj, indent=True):
+    """
+    Write obj to path as JSON and return (length_bytes, sha256 checksum)
+    of exactly what was written, without reading the file back.
+    """
+    data = dumpJson(obj, indent)
+    Path(path).write_bytes(data)
+    return len(data), hashlib.sha256(data).hexdigest()
+
+
+def loadJson(data):
+    """
+    Parse JSON from bytes or str, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def getFileLength(file_path):
@@ -50,3 +260,11 @@ def getFileLength(file_path):
     Get the length (size) of the file in bytes.
     """
     return os.path.getsize(file_path)
+
+
+def getFileSizeAndMtime(file_path):
+    """
+    Get the size in bytes and modification time in ns of a file with one stat.
+    """
+    st = os.stat(file_path)
+    return st.st_size, st.st_mtime_ns
@@ -43,13 +43,17 @@ Usage:
 """
 
 import argparse
-import json
+import atexit
+import logging
+import logging.handlers
 import os
-import re
+import queue
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import settings as cfg
 from vcat_testvector_datamodels import (
@@ -61,7 +65,19 @@ from vcat_testvector_datamodels import (
     VcatTestVectorCatalogAsset,
     VcatTestVectorCatalogIndex,
 )
-from utils import getChecksum, getFileLength
+from utils import (
+    CHECKSUM_ALGORITHMS,
+    dumpJson,
+    getChecksumAndLength,
+    getFileHasher,
+    loadChecksumCache,
+    loadJson,
+    writeJsonWithChecksum,
+)
+
+# Step progress and summaries; per-file lines go to the "vcat.files" child
+log = logging.getLogger("vcat")
+file_log = logging.getLogger("vcat.files")
 
 
 class BuilderConfig:
@@ -77,6 +93,7 @@ class BuilderConfig:
         description: Optional[str] = None,
         codec: Optional[str] = None,
         append_index: bool = False,
+        hash_algo: str = "sha256",
     ):
         self.input_folder = Path(input_folder).expanduser().resolve() if input_folder else cfg.BASE_OUTPUT_DIR
         # Output is always in input folder (relative paths require this)
@@ -85,6 +102,8 @@ class BuilderConfig:
         self.created_by = created_by or cfg.CREATED_BY
         self.codec = codec
         self.append_index = append_index
+        # Resolve "auto" once so every manifest in the run uses the same algorithm
+        self.checksum_algorithm, _ = getFileHasher(hash_algo)
 
         # Set catalog filename based on codec if specified
         if catalog_filename:
@@ -114,6 +133,28 @@ class BuilderConfig:
 # Video Manifest Generation
 # -----------------------------------------------------------------------------
 
+# ffprobe codec_name -> video_mime_type written to the manifest
+VIDEO_MIME_TYPES = {
+    "av1": "video/av1",
+    "vp9": 'video/mp4; codecs="vp09"',
+    "vvc": 'video/mp4; codecs="vvc"',
+    "h266": 'video/mp4; codecs="vvc"',
+}
+
+# (token in video_mime_type, title prefix), checked in order by generate_header_title
+HEADER_TITLE_CODECS = (
+    ("av1", "av1"),
+    ("vvc", "vvc"),
+    ("vp09", "vp9"),
+)
+
+# macOS artifacts skipped when walking the media folder
+MEDIA_EXCLUDE = frozenset({'.DS_Store', '__MACOSX'})
+
+# Seconds to wait for ffprobe before giving up on a file
+FFPROBE_TIMEOUT = 30
+
+
 def get_video_files_from_folder(media_folder: Path) -> List[Path]:
     """Return list of video files under the media folder."""
     if not media_folder.exists():
@@ -122,80 +163,111 @@ def get_video_files_from_folder(media_folder: Path) -> List[Path]:
     if not os.access(media_folder, os.R_OK | os.X_OK):
         raise PermissionError(f"Cannot read media folder: {media_folder}")
 
-    video_files = []
-    for root, dirs, files in os.walk(media_folder):
-        # Skip macOS artifacts
-        dirs[:] = [d for d in dirs if d not in ('.DS_Store', '__MACOSX')]
-        for name in files:
-            if name == '.DS_Store':
-                continue
-            video_files.append(Path(root) / name)
-
-    return video_files
+    return list(iter_media_files(media_folder))
 
 
-def get_video_details(file_path: Path) -> tuple:
-    """Get video codec, duration, resolution, and frame rate using FFmpeg."""
+def iter_media_files(media_folder: Path) -> Iterator[Path]:
+    """Yield every file under the media folder, using dirent types to avoid a stat per entry."""
+    stack = [media_folder]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable subfolders are skipped, as os.walk does
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.name in MEDIA_EXCLUDE:
+                    continue
+                if entry.is_dir():
+                    # Like os.walk, don't follow symlinked folders
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    yield Path(entry.path)
+
+
+def start_video_probe(file_path: Path) -> Optional[subprocess.Popen]:
+    """Launch ffprobe in the background so other work can overlap with it."""
     try:
-        result = subprocess.run(
-            ["ffmpeg", "-i", str(file_path)],
-            stderr=subprocess.PIPE,
+        return subprocess.Popen(
+            [
+                "ffprobe", "-v", "error",
+                "-select_streams", "v:0",
+                "-show_streams", "-show_format",
+                "-print_format", "json",
+                str(file_path)
+            ],
             stdout=subprocess.PIPE,
-            text=True
+            stderr=subprocess.DEVNULL
         )
-        stderr_output = result.stderr
+    except OSError as e:
+        file_log.warning(f"Error getting video details: {e}")
+        return None
+
+
+def stop_video_probe(probe: Optional[subprocess.Popen]):
+    """Kill a probe that was never collected and release its pipe."""
+    if probe is not None and probe.returncode is None:
+        probe.kill()
+        probe.communicate()
+
+
+def collect_video_details(probe: Optional[subprocess.Popen]) -> tuple:
+    """Wait for a probe from start_video_probe and parse codec, duration, resolution and frame rate."""
+    if probe is None:
+        return "unknown", "unknown", "unknown", "unknown"
+
+    try:
+        try:
+            output, _ = probe.communicate(timeout=FFPROBE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            probe.kill()
+            probe.communicate()
+            raise
+        if probe.returncode:
+            raise subprocess.CalledProcessError(probe.returncode, probe.args)
+
+        info = loadJson(output)
+        streams = info.get("streams") or [{}]
+        stream = streams[0]
+        fmt = info.get("format", {})
 
         # Detect codec
-        if "Video: av1" in stderr_output:
-            codec = "video/av1"
-        elif "Video: vp9" in stderr_output:
-            codec = 'video/mp4; codecs="vp09"'
-        elif "Video: vvc" in stderr_output:
-            codec = 'video/mp4; codecs="vvc"'
-        else:
-            codec = "Unknown"
+        codec = VIDEO_MIME_TYPES.get(stream.get("codec_name"), "Unknown")
 
         # Extract duration
         duration_ms = None
-        duration_match = re.search(r"Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})", stderr_output)
-        if duration_match:
-            hours = int(duration_match.group(1))
-            minutes = int(duration_match.group(2))
-            seconds = int(duration_match.group(3))
-            milliseconds = int(duration_match.group(4)) * 10
-            duration_ms = (hours * 3600 + minutes * 60 + seconds) * 1000 + milliseconds
+        if "duration" in fmt:
+            duration_ms = round(float(fmt["duration"]) * 1000)
 
         # Extract resolution
         resolution_x_y = None
-        resolution_match = re.search(r", (\d+)x(\d+),", stderr_output)
-        if resolution_match:
-            resolution_x_y = f"{resolution_match.group(1)}X{resolution_match.group(2)}"
+        if "width" in stream and "height" in stream:
+            resolution_x_y = f"{stream['width']}X{stream['height']}"
 
-        # Extract frame rate
+        # Extract frame rate ("num/den"), rounded to 2 decimals like ffmpeg prints it
         frame_rate = "unknown"
-        frame_rate_match = re.search(r"(\d+(\.\d+)?) fps", stderr_output)
-        if frame_rate_match:
-            frame_rate = f"{float(frame_rate_match.group(1)):g}"
+        num, _, den = stream.get("avg_frame_rate", "0/0").partition("/")
+        if float(num) and float(den or 1):
+            frame_rate = f"{round(float(num) / float(den or 1), 2):g}"
 
         return codec, duration_ms, resolution_x_y, frame_rate
 
     except Exception as e:
-        print(f"Error getting video details: {e}")
+        file_log.warning(f"Error getting video details: {e}")
         return "unknown", "unknown", "unknown", "unknown"
 
 
 def generate_header_title(video_file: str, video_mime_type: str, resolution_x_y: str, frame_rate: str) -> str:
     """Generate a descriptive title for the video manifest header."""
-    base_name = ""
+    mime = video_mime_type.lower()
+    prefix = next((name for token, name in HEADER_TITLE_CODECS if token in mime), None)
 
-    if 'av1' in video_mime_type.lower():
-        base_name = f"av1-{resolution_x_y}p{frame_rate}fps"
-    elif 'vvc' in video_mime_type.lower():
-        base_name = f"vvc-{resolution_x_y}p{frame_rate}fps"
-    elif 'vp09' in video_mime_type.lower():
-        base_name = f"vp9-{resolution_x_y}p{frame_rate}fps"
-
-    if not base_name:
+    if prefix:
+        base_name = f"{prefix}-{resolution_x_y}p{frame_rate}fps"
+    else:
         base_name = Path(video_file).stem
 
     # Handle film grain suffix
@@ -207,12 +279,50 @@ def generate_header_title(video_file: str, video_mime_type: str, resolution_x_y:
     return base_name
 
 
-def generate_video_manifest(video_path: Path, config: BuilderConfig) -> Optional[Path]:
+@dataclass
+class ManifestRecord:
+    """A video manifest written by this run, kept so its playlist needs no re-read."""
+    path: Path
+    manifest: dict
+    length_bytes: int
+    checksum: str
+
+
+def manifest_path_for(video_path: Path, config: BuilderConfig) -> Path:
+    """Path of the manifest generate_video_manifest writes for a video."""
+    return config.manifest_dir / f"{video_path.name}_video_manifest.json"
+
+
+def latest_video_per_manifest(video_files: List[Path], config: BuilderConfig) -> List[Path]:
+    """
+    Keep one video per manifest file. Manifests are named after the file
+    name alone, so same-named videos in different subfolders share one;
+    as in a sequential build, the last one wins.
+    """
+    latest: Dict[Path, Path] = {}
+    for video_path in video_files:
+        manifest_path = manifest_path_for(video_path, config)
+        if manifest_path in latest:
+            skipped = latest[manifest_path].relative_to(config.input_folder)
+            file_log.warning(
+                f"  → Warning: skipping {skipped}, "
+                f"{video_path.relative_to(config.input_folder)} also writes {manifest_path.name}"
+            )
+        latest[manifest_path] = video_path
+
+    return list(latest.values())
+
+
+def generate_video_manifest(video_path: Path, config: BuilderConfig) -> Optional[ManifestRecord]:
     """Generate a video manifest for a single video file."""
     try:
-        checksum = getChecksum(str(video_path))
-        length_bytes = getFileLength(str(video_path))
-        video_mime_type, duration_ms, resolution_x_y, frame_rate = get_video_details(video_path)
+        # Start ffprobe first so it runs while the file is being hashed
+        probe = start_video_probe(video_path)
+        try:
+            checksum, length_bytes = getChecksumAndLength(video_path, config.checksum_algorithm)
+            video_mime_type, duration_ms, resolution_x_y, frame_rate = collect_video_details(probe)
+        finally:
+            stop_video_probe(probe)
 
         # Build relative URL from manifest to media file
         rel_path = video_path.relative_to(config.input_folder)
@@ -234,7 +344,8 @@ def generate_video_manifest(video_path: Path, config: BuilderConfig) -> Optional
             video_mime_type=video_mime_type,
             duration_ms=duration_ms,
             resolution_x_y=resolution_x_y,
-            frame_rate=frame_rate
+            frame_rate=frame_rate,
+            checksum_algorithm=config.checksum_algorithm
         )
 
         manifest = {
@@ -242,15 +353,20 @@ def generate_video_manifest(video_path: Path, config: BuilderConfig) -> Optional
             "media_asset": media_asset.to_dict()
         }
 
-        out_path = config.manifest_dir / f"{video_path.name}_video_manifest.json"
-        with out_path.open("w") as f:
-            json.dump(manifest, f, indent=2)
+        # Manifests and playlists are only read by tools, so they are written compact
+        out_path = manifest_path_for(video_path, config)
+        manifest_length, manifest_checksum = writeJsonWithChecksum(out_path, manifest, indent=False)
 
-        print(f"  ✔ {out_path.name}")
-        return out_path
+        file_log.info(f"  ✔ {out_path.name}")
+        return ManifestRecord(
+            path=out_path,
+            manifest=manifest,
+            length_bytes=manifest_length,
+            checksum=manifest_checksum
+        )
 
     except Exception as e:
-        print(f"  ✗ Error processing {video_path.name}: {e}")
+        file_log.error(f"  ✗ Error processing {video_path.name}: {e}")
         return None
 
 
@@ -258,27 +374,58 @@ def generate_video_manifest(video_path: Path, config: BuilderConfig) -> Optional
 # Playlist Generation
 # -----------------------------------------------------------------------------
 
-def generate_playlist_from_manifest(manifest_path: Path, config: BuilderConfig) -> Optional[Path]:
-    """Generate a playlist from a video manifest."""
-    try:
-        with manifest_path.open("r") as f:
-            video_manifest = json.load(f)
+@dataclass
+class PlaylistRecord:
+    """A playlist written by this run, with what the catalog needs to list it."""
+    path: Path
+    header: dict
+    length_bytes: int
+    checksum: str
+
+
+def playlist_path_for(manifest: ManifestRecord, config: BuilderConfig) -> Path:
+    """Path of the playlist generate_playlist_from_manifest writes for a manifest."""
+    return config.manifest_dir / f"{manifest.manifest['vcat_testvector_header']['name']}_playlist.json"
+
+
+def latest_manifest_per_playlist(manifests: List[ManifestRecord], config: BuilderConfig) -> List[ManifestRecord]:
+    """
+    Keep one manifest per playlist file. Playlists are named after the
+    header title, so every video with the same codec, resolution and frame
+    rate maps to the same file; as in a sequential build, the last one wins.
+    """
+    latest: Dict[Path, ManifestRecord] = {}
+    for manifest in manifests:
+        playlist_path = playlist_path_for(manifest, config)
+        if playlist_path in latest:
+            file_log.info(
+                f"  → {playlist_path.name} will list {manifest.path.name} "
+                f"instead of {latest[playlist_path].path.name}"
+            )
+        latest[playlist_path] = manifest
+
+    return list(latest.values())
 
-        header = video_manifest["vcat_testvector_header"]
-        ma = video_manifest["media_asset"]
+
+def generate_playlist_from_manifest(manifest: ManifestRecord, config: BuilderConfig) -> Optional[PlaylistRecord]:
+    """Generate a playlist from a video manifest written by generate_video_manifest."""
+    manifest_path = manifest.path
+
+    try:
+        header = manifest.manifest["vcat_testvector_header"]
+        ma = manifest.manifest["media_asset"]
 
         if "video_mime_type" not in ma:
-            print(f"  → Skipping {manifest_path.name}, not a video manifest")
+            file_log.info(f"  → Skipping {manifest_path.name}, not a video manifest")
             return None
 
-        manifest_checksum = getChecksum(str(manifest_path))
         asset_url = f"./manifests/{manifest_path.name}"
 
         playlist_asset = VcatTestVectorPlaylistAsset(
             name=header["name"],
             url=asset_url,
-            checksum=manifest_checksum,
-            length_bytes=manifest_path.stat().st_size,
+            checksum=manifest.checksum,
+            length_bytes=manifest.length_bytes,
             uuid=header["uuid"],
             description=header["description"]
         )
@@ -294,15 +441,21 @@ def generate_playlist_from_manifest(manifest_path: Path, config: BuilderConfig)
             media_assets=[playlist_asset]
         )
 
-        out_path = config.manifest_dir / f"{playlist_header.name}_playlist.json"
-        with out_path.open("w") as f:
-            json.dump(playlist_manifest.to_dict(), f, indent=2)
+        out_path = playlist_path_for(manifest, config)
+        playlist_length, playlist_checksum = writeJsonWithChecksum(
+            out_path, playlist_manifest.to_dict(), indent=False
+        )
 
-        print(f"  ✔ {out_path.name}")
-        return out_path
+        file_log.info(f"  ✔ {out_path.name}")
+        return PlaylistRecord(
+            path=out_path,
+            header=playlist_header.to_dict(),
+            length_bytes=playlist_length,
+            checksum=playlist_checksum
+        )
 
     except Exception as e:
-        print(f"  ✗ Error generating playlist from {manifest_path.name}: {e}")
+        file_log.error(f"  ✗ Error generating playlist from {manifest_path.name}: {e}")
         return None
 
 
@@ -310,37 +463,53 @@ def generate_playlist_from_manifest(manifest_path: Path, config: BuilderConfig)
 # Catalog Generation
 # -----------------------------------------------------------------------------
 
-def generate_catalog(config: BuilderConfig) -> Optional[Path]:
-    """Generate catalog from all playlists."""
-    playlist_files = list(config.manifest_dir.glob("*_playlist.json"))
-
-    if not playlist_files:
-        print("  ✗ No playlist files found")
+@dataclass
+class CatalogRecord:
+    """The catalog written by this run, with what the index needs to list it."""
+    path: Path
+    catalog: dict
+    length_bytes: int
+    checksum: str
+
+
+def generate_catalog(
+    records: List[PlaylistRecord],
+    config: BuilderConfig,
+) -> Optional[CatalogRecord]:
+    """Generate catalog from the playlists written earlier in this run."""
+    if not records:
+        log.error("  ✗ No playlist files found")
         return None
 
-    assets: List[VcatTestVectorPlaylistAsset] = []
+    assets = [
+        make_catalog_playlist_asset(
+            record.path, record.header, record.checksum, record.length_bytes
+        )
+        for record in records
+    ]
+
+    return write_catalog(assets, config)
+
+
+def make_catalog_playlist_asset(
+    playlist_path: Path,
+    hdr: dict,
+    checksum: str,
+    length_bytes: int,
+) -> VcatTestVectorPlaylistAsset:
+    """Describe one playlist file as a catalog entry."""
+    return VcatTestVectorPlaylistAsset(
+        name=hdr["name"],
+        url=f"./manifests/{playlist_path.name}",
+        checksum=checksum,
+        length_bytes=length_bytes,
+        uuid=hdr["uuid"],
+        description=hdr["description"]
+    )
 
-    for p in playlist_files:
-        try:
-            data = json.loads(p.read_text())
-            hdr = data["vcat_testvector_header"]
-
-            checksum = getChecksum(str(p))
-            length_bytes = p.stat().st_size
-            rel_url = f"./manifests/{p.name}"
-
-            asset = VcatTestVectorPlaylistAsset(
-                name=hdr["name"],
-                url=rel_url,
-                checksum=checksum,
-                length_bytes=length_bytes,
-                uuid=hdr["uuid"],
-                description=hdr["description"]
-            )
-            assets.append(asset)
-        except Exception as e:
-            print(f"  ✗ Error reading playlist {p.name}: {e}")
 
+def write_catalog(assets: List[VcatTestVectorPlaylistAsset], config: BuilderConfig) -> CatalogRecord:
+    """Write the catalog for the given playlist assets."""
     catalog_header = VcatTestVectorHeader(
         name=config.catalog_name,
         description=config.description,
@@ -352,42 +521,38 @@ def generate_catalog(config: BuilderConfig) -> Optional[Path]:
         playlists=assets
     )
 
+    catalog_dict = catalog.to_dict()
     out_path = config.output_dir / config.catalog_filename
-    with out_path.open("w") as f:
-        json.dump(catalog.to_dict(), f, indent=2)
-
-    print(f"  ✔ {out_path.name}")
-    return out_path
+    length_bytes, checksum = writeJsonWithChecksum(out_path, catalog_dict)
+
+    log.info(f"  ✔ {out_path.name}")
+    return CatalogRecord(
+        path=out_path,
+        catalog=catalog_dict,
+        length_bytes=length_bytes,
+        checksum=checksum
+    )
 
 
 # -----------------------------------------------------------------------------
 # Index Generation
 # -----------------------------------------------------------------------------
 
-def generate_index(catalog_path: Path, config: BuilderConfig) -> Optional[Path]:
-    """Generate catalog index from the catalog."""
-    if not catalog_path or not catalog_path.exists():
-        print("  ✗ No catalog file to index")
+def generate_index(catalog: Optional[CatalogRecord], config: BuilderConfig) -> Optional[Path]:
+    """Generate catalog index from the catalog written earlier in this run."""
+    if not catalog:
+        log.error("  ✗ No catalog file to index")
         return None
 
     try:
-        data = json.loads(catalog_path.read_text())
-
-        # Verify it has playlists section
-        if "playlists" not in data:
-            print(f"  ✗ Catalog missing 'playlists' section")
-            return None
-
-        hdr = data["vcat_testvector_header"]
-        checksum = getChecksum(str(catalog_path))
-        length_bytes = catalog_path.stat().st_size
-        rel_url = f"./{catalog_path.name}"
+        hdr = catalog.catalog["vcat_testvector_header"]
+        rel_url = f"./{catalog.path.name}"
 
         asset = VcatTestVectorCatalogAsset(
             name=hdr["name"],
             url=rel_url,
-            checksum=checksum,
-            length_bytes=length_bytes,
+            checksum=catalog.checksum,
+            length_bytes=catalog.length_bytes,
             uuid=hdr["uuid"],
             description=hdr["description"]
         )
@@ -398,13 +563,13 @@ def generate_index(catalog_path: Path, config: BuilderConfig) -> Optional[Path]:
         existing_catalogs = []
         if config.append_index and out_path.exists():
             try:
-                existing_data = json.loads(out_path.read_text())
+                existing_data = loadJson(out_path.read_bytes())
                 existing_catalogs = existing_data.get("catalogs", [])
                 # Filter out any existing entry with the same URL to avoid duplicates
                 existing_catalogs = [c for c in existing_catalogs if c.get("url") != rel_url]
-                print(f"  → Appending to existing index with {len(existing_catalogs)} catalog(s)")
+                log.info(f"  → Appending to existing index with {len(existing_catalogs)} catalog(s)")
             except Exception as e:
-                print(f"  → Warning: Could not read existing index, creating new: {e}")
+                log.warning(f"  → Warning: Could not read existing index, creating new: {e}")
 
         index_header = VcatTestVectorHeader(
             name=config.index_name,
@@ -424,14 +589,13 @@ def generate_index(catalog_path: Path, config: BuilderConfig) -> Optional[Path]:
         index_dict = index.to_dict()
         index_dict["catalogs"] = all_catalogs
 
-        with out_path.open("w") as f:
-            json.dump(index_dict, f, indent=2)
+        out_path.write_bytes(dumpJson(index_dict))
 
-        print(f"  ✔ {out_path.name}")
+        log.info(f"  ✔ {out_path.name}")
         return out_path
 
     except Exception as e:
-        print(f"  ✗ Error generating index: {e}")
+        log.error(f"  ✗ Error generating index: {e}")
         return None
 
 
@@ -439,60 +603,90 @@ def generate_index(catalog_path: Path, config: BuilderConfig) -> Optional[Path]:
 # Main Pipeline
 # -----------------------------------------------------------------------------
 
+def run_parallel(func, items, config: BuilderConfig) -> list:
+    """
+    Run func(item, config) for every item concurrently and collect the
+    non-empty results in the order of items, so output is reproducible.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(func, items, [config] * len(items))
+        return [result for result in results if result]
+
+
 def build(config: BuilderConfig):
     """Run the full build pipeline."""
     # Validate input folder
     if not config.input_folder.exists():
-        print(f"Error: Input folder does not exist: {config.input_folder}")
+        log.error(f"Error: Input folder does not exist: {config.input_folder}")
         sys.exit(1)
 
     if not config.media_folder.exists():
-        print(f"Error: Input folder must contain a 'media' subfolder: {config.media_folder}")
+        log.error(f"Error: Input folder must contain a 'media' subfolder: {config.media_folder}")
         sys.exit(1)
 
     # Create manifest directory only after validation
     config.manifest_dir.mkdir(parents=True, exist_ok=True)
+    loadChecksumCache(cfg.CHECKSUM_CACHE_FILE)
 
-    print(f"Building from: {config.input_folder}")
-    print()
+    log.info(f"Building from: {config.input_folder}")
+    log.info("")
 
     # Step 1: Generate video manifests
-    print("Step 1: Generating video manifests...")
+    log.info("Step 1: Generating video manifests...")
     video_files = get_video_files_from_folder(config.media_folder)
-    print(f"  Found {len(video_files)} video file(s)")
+    log.info(f"  Found {len(video_files)} video file(s)")
 
-    manifest_paths = []
-    for video_path in video_files:
-        result = generate_video_manifest(video_path, config)
-        if result:
-            manifest_paths.append(result)
-    print()
-
-    # Step 2: Generate playlists
-    print("Step 2: Generating playlists...")
-    playlist_paths = []
-    for manifest_path in manifest_paths:
-        result = generate_playlist_from_manifest(manifest_path, config)
-        if result:
-            playlist_paths.append(result)
-    print()
+    # Workers write manifests concurrently, so each manifest file gets a single writer
+    manifest_records = run_parallel(
+        generate_video_manifest,
+        latest_video_per_manifest(video_files, config),
+        config
+    )
+    log.info("")
+
+    # Step 2: Generate playlists, one writer per playlist file
+    log.info("Step 2: Generating playlists...")
+    playlist_records = run_parallel(
+        generate_playlist_from_manifest,
+        latest_manifest_per_playlist(manifest_records, config),
+        config
+    )
+    log.info("")
 
     # Step 3: Generate catalog
-    print("Step 3: Generating catalog...")
-    catalog_path = generate_catalog(config)
-    print()
+    log.info("Step 3: Generating catalog...")
+    catalog = generate_catalog(playlist_records, config)
+    log.info("")
 
     # Step 4: Generate index
-    print("Step 4: Generating catalog index...")
-    index_path = generate_index(catalog_path, config)
-    print()
+    log.info("Step 4: Generating catalog index...")
+    index_path = generate_index(catalog, config)
+    log.info("")
 
     # Summary
-    print("Build complete!")
-    print(f"  Video manifests: {len(manifest_paths)}")
-    print(f"  Playlists: {len(playlist_paths)}")
-    print(f"  Catalog: {catalog_path}")
-    print(f"  Index: {index_path}")
+    log.info("Build complete!")
+    log.info(f"  Video manifests: {len(manifest_records)}")
+    log.info(f"  Playlists: {len(playlist_records)}")
+    log.info(f"  Catalog: {catalog.path if catalog else None}")
+    log.info(f"  Index: {index_path}")
+
+
+def configure_logging(quiet: bool = False):
+    """
+    Print builder output to stdout through a queue, so worker threads hand
+    off their per-file lines instead of contending for the console.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    if quiet:
+        file_log.setLevel(logging.WARNING)
+
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def parse_args():
@@ -551,20 +745,40 @@ Examples:
         help="Append to existing index file instead of overwriting"
     )
 
+    parser.add_argument(
+        "--hash-algo",
+        choices=CHECKSUM_ALGORITHMS,
+        default="sha256",
+        help="Checksum algorithm for video assets; 'auto' uses blake3 on CPUs without SHA extensions "
+             "when the blake3 package is installed, 'xxh3' needs the xxhash package (default: sha256)"
+    )
+
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only print step progress, warnings and errors, not a line per generated file"
+    )
+
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
+    configure_logging(args.quiet)
 
-    config = BuilderConfig(
-        input_folder=args.input_folder,
-        created_by=args.created_by,
-        catalog_filename=args.catalog_filename,
-        description=args.description,
-        codec=args.codec,
-        append_index=args.append_index,
-    )
+    try:
+        config = BuilderConfig(
+            input_folder=args.input_folder,
+            created_by=args.created_by,
+            catalog_filename=args.catalog_filename,
+            description=args.description,
+            codec=args.codec,
+            append_index=args.append_index,
+            hash_algo=args.hash_algo,
+        )
+    except ValueError as e:
+        log.error(f"Error: {e}")
+        sys.exit(1)
 
     build(config)
 
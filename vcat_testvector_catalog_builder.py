@@ -29,7 +29,7 @@
 #
 # Contact: legal@roncatech.com
 
-import json
+import hashlib
 from pathlib import Path
 from typing import List
 
@@ -39,7 +39,7 @@ from vcat_testvector_datamodels import (
     VcatTestVectorPlaylistCatalog,
     VcatTestVectorHeader
 )
-from utils import getChecksum
+from utils import dumpJson, loadJson
 
 def find_local_playlists() -> List[Path]:
     """
@@ -56,12 +56,13 @@ def build_catalog() -> VcatTestVectorPlaylistCatalog:
 
     for p in playlist_files:
         # 1) Load the JSON just to pull out the header fields
-        data = json.loads(p.read_text())
+        raw  = p.read_bytes()
+        data = loadJson(raw)
         hdr  = data["vcat_testvector_header"]
 
-        # 2) Compute checksum & length of the .json file itself
-        checksum     = getChecksum(str(p))
-        length_bytes = p.stat().st_size
+        # 2) Compute checksum & length of the .json file from the same bytes
+        checksum     = hashlib.sha256(raw).hexdigest()
+        length_bytes = len(raw)
 
         # 3) Build the “url” field relative to the catalog’s location.
         #    If your catalog lives at BASE_OUTPUT_DIR, and playlists in MANIFEST_DIR,
@@ -96,8 +97,7 @@ def write_catalog_to_disk(catalog: VcatTestVectorPlaylistCatalog):
     """
     out_path = cfg.BASE_OUTPUT_DIR / "vcat_testvector_playlist_catalog.json"
 
-    with out_path.open("w") as f:
-        json.dump(catalog.to_dict(), f, indent=2)
+    out_path.write_bytes(dumpJson(catalog.to_dict()))
 
     print(f"▶️  Catalog written to {out_path}")
 
@@ -76,6 +76,7 @@ class VcatTestVectorVideoAsset(VcatTestVectorAsset):
     duration_ms: Optional[int]
     resolution_x_y: str
     frame_rate: str
+    checksum_algorithm: str = "sha256"  # Only written out when not the default
 
     def to_dict(self) -> dict:
         """Converts the VcatTestVectorVideoAsset instance to a dictionary."""
@@ -86,6 +87,8 @@ class VcatTestVectorVideoAsset(VcatTestVectorAsset):
             "resolution_x_y": self.resolution_x_y,
             "frame_rate": self.frame_rate
         })
+        if self.checksum_algorithm != "sha256":
+            asset_dict["checksum_algorithm"] = self.checksum_algorithm
         return asset_dict
 
 @dataclass
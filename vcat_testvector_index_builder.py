@@ -30,8 +30,9 @@
 # Contact: legal@roncatech.com
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 import settings as cfg
 from vcat_testvector_datamodels import (
@@ -39,28 +40,39 @@ from vcat_testvector_datamodels import (
     VcatTestVectorCatalogIndex,
     VcatTestVectorHeader
 )
-from utils import getChecksum
+from utils import dumpJson, getChecksum, loadJson
 
 OUTPUT_FILENAME = "vcat_testvector_catalog_index.json"
 
 
-def find_local_catalogs() -> List[Path]:
+def _load_one(p: Path) -> Tuple[Path, Optional[dict]]:
     """
-    Return all *_catalog.json files under cfg.BASE_OUTPUT_DIR
-    that contain a 'playlists' section.
+    Read and parse one catalog file; data is None if it can't be loaded.
+    """
+    try:
+        raw = p.read_bytes()
+        # Cheap pre-filter: a catalog can't have a 'playlists' key without this token
+        if b'"playlists"' not in raw:
+            return p, None
+        return p, loadJson(raw)
+    except (json.JSONDecodeError, IOError):
+        return p, None
+
+
+def find_local_catalogs() -> List[Tuple[Path, dict]]:
+    """
+    Return (path, parsed JSON) for all *_catalog.json files under
+    cfg.BASE_OUTPUT_DIR that contain a 'playlists' section.
     """
     candidates = list(cfg.BASE_OUTPUT_DIR.glob("*_catalog.json"))
-    valid_catalogs = []
 
-    for p in candidates:
-        try:
-            data = json.loads(p.read_text())
-            if "playlists" in data:
-                valid_catalogs.append(p)
-        except (json.JSONDecodeError, IOError):
-            continue
+    with ThreadPoolExecutor(max_workers=min(32, len(candidates) or 1)) as executor:
+        results = list(executor.map(_load_one, candidates))
 
-    return valid_catalogs
+    return [
+        (p, data) for p, data in results
+        if isinstance(data, dict) and "playlists" in data
+    ]
 
 
 def build_index() -> VcatTestVectorCatalogIndex:
@@ -70,9 +82,8 @@ def build_index() -> VcatTestVectorCatalogIndex:
     catalog_files = find_local_catalogs()
     assets: List[VcatTestVectorCatalogAsset] = []
 
-    for p in catalog_files:
-        # 1) Load the JSON to pull out the header fields
-        data = json.loads(p.read_text())
+    for p, data in catalog_files:
+        # 1) Pull out the header fields from the already-parsed JSON
         hdr = data["vcat_testvector_header"]
 
         # 2) Compute checksum & length of the .json file itself
@@ -111,8 +122,7 @@ def write_index_to_disk(index: VcatTestVectorCatalogIndex):
     """
     out_path = cfg.BASE_OUTPUT_DIR / OUTPUT_FILENAME
 
-    with out_path.open("w") as f:
-        json.dump(index.to_dict(), f, indent=2)
+    out_path.write_bytes(dumpJson(index.to_dict()))
 
     print(f"▶️  Index written to {out_path}")
 
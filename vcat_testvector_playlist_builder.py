@@ -29,7 +29,6 @@
 #
 # Contact: legal@roncatech.com
 
-import json
 from pathlib import Path
 from typing import List
 
@@ -39,7 +38,7 @@ from vcat_testvector_datamodels import (
     VcatTestVectorPlaylistManifest,
     VcatTestVectorHeader
 )
-from utils import getChecksum
+from utils import dumpJson, getChecksum, loadJson
 
 def get_video_manifests_local() -> List[Path]:
     """
@@ -54,8 +53,7 @@ def generate_playlist_from_video_manifest(manifest_path: Path):
     manifest, and write it back into the same folder.
     """
     # 1) Load the video manifest JSON
-    with manifest_path.open("r") as f:
-        video_manifest = json.load(f)
+    video_manifest = loadJson(manifest_path.read_bytes())
 
     header = video_manifest["vcat_testvector_header"]
     ma     = video_manifest["media_asset"]
@@ -96,8 +94,7 @@ def generate_playlist_from_video_manifest(manifest_path: Path):
     # 7) Write it back out alongside the video manifests
     out_name   = f"{playlist_header.name}_playlist.json"
     out_path   = cfg.MANIFEST_DIR / out_name
-    with out_path.open("w") as out:
-        json.dump(playlist_manifest.to_dict(), out, indent=2)
+    out_path.write_bytes(dumpJson(playlist_manifest.to_dict(), indent=False))
 
     print(f"✔ Wrote playlist {out_name} in {cfg.MANIFEST_DIR}")
 
@@ -35,13 +35,36 @@ Video manifest builder - generates manifests for video files in a local folder.
 import os
 import json
 import subprocess
-import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import vcat_testvector_datamodels
-from utils import getChecksum, getFileLength
+from utils import dumpJson, getChecksumAndLength, loadChecksumCache
 import settings as cfg
 
 
+# ffprobe codec_name -> video_mime_type written to the manifest
+_VIDEO_MIME_TYPES = {
+    "av1": "video/av1",
+    "vp9": 'video/mp4; codecs="vp09"',
+    "vvc": 'video/mp4; codecs="vvc"',
+    "h266": 'video/mp4; codecs="vvc"',
+}
+
+# (token in video_mime_type, title prefix), checked in order by generate_header_title
+_HEADER_TITLE_CODECS = (
+    ("av1", "av1"),
+    ("vvc", "vvc"),
+    ("vp09", "vp9"),
+)
+
+# macOS artifacts skipped when walking the media folder
+_EXCLUDE = frozenset({'.DS_Store', '__MACOSX'})
+
+# Seconds to wait for ffprobe before giving up on a file
+_FFPROBE_TIMEOUT = 30
+
+
 def get_video_files_from_folder(folderpath):
     """
     Return a list of files under '<folderpath>/media'.
@@ -58,62 +81,101 @@ def get_video_files_from_folder(folderpath):
         print(f"Error: Cannot read media folder: {media_folder}")
         return []
 
-    video_files = []
-    for root, dirs, files in os.walk(media_folder):
-        dirs[:] = [d for d in dirs if d not in ('.DS_Store', '__MACOSX')]
-        for name in files:
-            if name == '.DS_Store':
-                continue
-            relative = os.path.join("media", os.path.relpath(root, media_folder))
-            video_files.append(os.path.join(relative, name))
+    return [
+        os.path.join("media", os.path.relpath(path, media_folder))
+        for path in _iter_media(media_folder)
+    ]
+
+
+def _iter_media(media_folder):
+    """Yield every file path under the media folder without a stat per entry."""
+    stack = [media_folder]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable subfolders are skipped, as os.walk does
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.name in _EXCLUDE:
+                    continue
+                if entry.is_dir():
+                    # Like os.walk, don't follow symlinked folders
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    yield entry.path
+
+
+def start_video_probe(file_path):
+    """Launch ffprobe in the background so the checksum can overlap with it."""
+    try:
+        return subprocess.Popen(
+            [
+                "ffprobe", "-v", "error",
+                "-select_streams", "v:0",
+                "-show_streams", "-show_format",
+                "-print_format", "json",
+                file_path
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+    except OSError as e:
+        print(f"Error getting video details: {e}")
+        return None
+
 
-    return video_files
+def stop_video_probe(probe):
+    """Kill a probe that was never collected and release its pipe."""
+    if probe is not None and probe.returncode is None:
+        probe.kill()
+        probe.communicate()
 
 
-def get_video_details(file_path):
+def collect_video_details(probe):
     """
-    Get video codec, duration, resolution, and frame rate using FFmpeg.
+    Wait for a probe from start_video_probe and parse the video codec,
+    duration, resolution, and frame rate from its output.
     """
+    if probe is None:
+        return "unknown", "unknown", "unknown", "unknown"
+
     try:
-        result = subprocess.run(
-            ["ffmpeg", "-i", file_path],
-            stderr=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            text=True
-        )
-        stderr_output = result.stderr
+        try:
+            output, _ = probe.communicate(timeout=_FFPROBE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            probe.kill()
+            probe.communicate()
+            raise
+        if probe.returncode:
+            raise subprocess.CalledProcessError(probe.returncode, probe.args)
+
+        info = json.loads(output)
+        streams = info.get("streams") or [{}]
+        stream = streams[0]
+        fmt = info.get("format", {})
 
         # Detect codec
-        if "Video: av1" in stderr_output:
-            codec = "video/av1"
-        elif "Video: vp9" in stderr_output:
-            codec = 'video/mp4; codecs="vp09"'
-        elif "Video: vvc" in stderr_output:
-            codec = 'video/mp4; codecs="vvc"'
-        else:
-            codec = "Unknown"
+        codec = _VIDEO_MIME_TYPES.get(stream.get("codec_name"), "Unknown")
 
         # Extract duration
         duration_ms = None
-        duration_match = re.search(r"Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})", stderr_output)
-        if duration_match:
-            hours = int(duration_match.group(1))
-            minutes = int(duration_match.group(2))
-            seconds = int(duration_match.group(3))
-            milliseconds = int(duration_match.group(4)) * 10
-            duration_ms = (hours * 3600 + minutes * 60 + seconds) * 1000 + milliseconds
+        if "duration" in fmt:
+            duration_ms = round(float(fmt["duration"]) * 1000)
 
         # Extract resolution
         resolution_x_y = None
-        resolution_match = re.search(r", (\d+)x(\d+),", stderr_output)
-        if resolution_match:
-            resolution_x_y = f"{resolution_match.group(1)}X{resolution_match.group(2)}"
+        if "width" in stream and "height" in stream:
+            resolution_x_y = f"{stream['width']}X{stream['height']}"
 
-        # Extract frame rate
+        # Extract frame rate ("num/den"), rounded to 2 decimals like ffmpeg prints it
         frame_rate = "unknown"
-        frame_rate_match = re.search(r"(\d+(\.\d+)?) fps", stderr_output)
-        if frame_rate_match:
-            frame_rate = f"{float(frame_rate_match.group(1)):g}"
+        num, _, den = stream.get("avg_frame_rate", "0/0").partition("/")
+        if float(num) and float(den or 1):
+            frame_rate = f"{round(float(num) / float(den or 1), 2):g}"
 
         return codec, duration_ms, resolution_x_y, frame_rate
 
@@ -124,16 +186,12 @@ def get_video_details(file_path):
 
 def generate_header_title(video_file, video_mime_type, resolution_x_y, frame_rate):
     """Generate a descriptive title for the video manifest header."""
-    base_name = ""
-
-    if 'av1' in video_mime_type.lower():
-        base_name = f"av1-{resolution_x_y}p{frame_rate}fps"
-    elif 'vvc' in video_mime_type.lower():
-        base_name = f"vvc-{resolution_x_y}p{frame_rate}fps"
-    elif 'vp09' in video_mime_type.lower():
-        base_name = f"vp9-{resolution_x_y}p{frame_rate}fps"
+    mime = video_mime_type.lower()
+    prefix = next((name for token, name in _HEADER_TITLE_CODECS if token in mime), None)
 
-    if not base_name:
+    if prefix:
+        base_name = f"{prefix}-{resolution_x_y}p{frame_rate}fps"
+    else:
         base_name = video_file.split('/')[-1]
 
     # Handle film grain suffix
@@ -145,15 +203,41 @@ def generate_header_title(video_file, video_mime_type, resolution_x_y, frame_rat
     return base_name
 
 
+def manifest_path_for(video_file):
+    """Path of the manifest generate_video_manifest writes for a video."""
+    clean_name = video_file.split("/")[-1]
+    return f"{cfg.MANIFEST_DIR}/{clean_name}_video_manifest.json"
+
+
+def latest_video_per_manifest(video_files):
+    """
+    Keep one video per manifest file. Manifests are named after the file
+    name alone, so same-named videos in different subfolders share one;
+    as in a sequential run, the last one wins.
+    """
+    latest = {}
+    for video_file in video_files:
+        out = manifest_path_for(video_file)
+        if out in latest:
+            print(f"Warning: skipping {latest[out]}, {video_file} also writes {out}")
+        latest[out] = video_file
+
+    return list(latest.values())
+
+
 def generate_video_manifest(video_file, base_folder, created_by):
     """Generate a video manifest for a local video file."""
     local_file = os.path.join(base_folder, video_file)
     video_url = f"../{video_file}"
 
     try:
-        checksum = getChecksum(local_file)
-        length_bytes = getFileLength(local_file)
-        video_mime_type, duration_ms, resolution_x_y, frame_rate = get_video_details(local_file)
+        # Let ffprobe run while the file is being hashed
+        probe = start_video_probe(local_file)
+        try:
+            checksum, length_bytes = getChecksumAndLength(local_file)
+            video_mime_type, duration_ms, resolution_x_y, frame_rate = collect_video_details(probe)
+        finally:
+            stop_video_probe(probe)
 
         header_title = generate_header_title(video_file, video_mime_type, resolution_x_y, frame_rate)
         header_description = (
@@ -176,10 +260,8 @@ def generate_video_manifest(video_file, base_folder, created_by):
             "media_asset": media_asset.to_dict()
         }
 
-        clean_name = video_file.split("/")[-1]
-        out = f"{cfg.MANIFEST_DIR}/{clean_name}_video_manifest.json"
-        with open(out, "w") as f:
-            json.dump(test_vector, f, indent=4)
+        out = manifest_path_for(video_file)
+        Path(out).write_bytes(dumpJson(test_vector, indent=False))
         print(f"✔ Wrote {out}")
 
     except Exception as e:
@@ -192,12 +274,18 @@ def main():
 
     # Ensure manifest directory exists
     cfg.MANIFEST_DIR.mkdir(parents=True, exist_ok=True)
+    loadChecksumCache(cfg.CHECKSUM_CACHE_FILE)
 
     video_files = get_video_files_from_folder(base_folder)
     print(f"Found {len(video_files)} video file(s)")
 
-    for video_file in video_files:
-        generate_video_manifest(video_file, base_folder, created_by)
+    # Workers write concurrently, so each manifest file must have a single writer
+    video_files = latest_video_per_manifest(video_files)
+
+    # Hashing and waiting on ffprobe both release the GIL, so threads process files in parallel
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for video_file in video_files:
+            executor.submit(generate_video_manifest, video_file, base_folder, created_by)
 
 
 if __name__ == "__main__":